@@ -0,0 +1,150 @@
+# conftest.py
+"""
+Фикстуры pytest для test_cargopro_api.py
+"""
+
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+import test_cargopro_api as api
+
+
+def pytest_configure(config):
+    # Марку регистрирует pytest-xdist; объявляем ее и для запуска без плагина
+    config.addinivalue_line("markers", "xdist_group(name): тесты одной группы выполняются на одном воркере")
+
+
+@pytest.fixture(scope="session")
+def ctx():
+    """Контекст прогона: в него пишут входы и фикстуры, из него берут заголовки запросы тестов"""
+    return api.CONTEXT
+
+
+@pytest.fixture(scope="session")
+def http_session(ctx):
+    """Общая HTTP-сессия"""
+    return ctx.session
+
+
+@pytest.fixture(scope="session")
+def server_available(http_session):
+    """Проверка доступности сервера до первого теста; без сервера прогон прерывается"""
+    # HEAD без тела ответа; соединение остается в пуле сессии для первых тестов
+    try:
+        response = http_session.head(api.BASE_URL, timeout=5, allow_redirects=False)
+    except requests.exceptions.RequestException as e:
+        pytest.exit(f"Не удалось подключиться к серверу {api.BASE_URL}: {e}", returncode=1)
+    # 405 - сервер жив, но HEAD для / не реализован
+    if response.status_code not in (200, 405):
+        pytest.exit(f"Сервер недоступен или вернул ошибку: {response.status_code}", returncode=1)
+    api.report.info("✓ Сервер доступен по адресу %s", api.BASE_URL)
+    return True
+
+
+@pytest.fixture(scope="session")
+def logins(ctx):
+    """Входы всех тестовых ролей: роль -> Future с ответом /auth/login (None, если вход не удался)"""
+    # Входы независимы и пишут в разные ключи контекста, поэтому выполняются параллельно;
+    # ошибка одной роли остается в ее Future и не мешает тестам других ролей
+    with ThreadPoolExecutor(max_workers=len(api.LOGIN_CASES)) as executor:
+        return {
+            role: executor.submit(api.login_user, ctx, creds, role)
+            for role, creds in api.LOGIN_CASES
+        }
+
+
+def role_login(logins, role):
+    """Ответ /auth/login роли; ошибка входа поднимается только в фикстуре этой роли"""
+    data = logins[role].result()
+    assert data, f"Login failed for {role}"
+    return data
+
+
+@pytest.fixture(scope="session")
+def admin_login(logins):
+    """Ответ /auth/login администратора"""
+    return role_login(logins, "admin")
+
+
+@pytest.fixture(scope="session")
+def client_login(logins):
+    """Ответ /auth/login клиента"""
+    return role_login(logins, "client")
+
+
+@pytest.fixture(scope="session")
+def driver_login(logins):
+    """Ответ /auth/login водителя"""
+    return role_login(logins, "driver")
+
+
+@pytest.fixture(scope="session")
+def admin_token(admin_login):
+    """Токен администратора"""
+    return admin_login["access_token"]
+
+
+@pytest.fixture(scope="session")
+def client_token(client_login):
+    """Токен клиента"""
+    return client_login["access_token"]
+
+
+@pytest.fixture(scope="session")
+def driver_token(driver_login):
+    """Токен водителя"""
+    return driver_login["access_token"]
+
+
+@pytest.fixture(scope="session")
+def created_order(ctx, client_token):
+    """Заказ, созданный клиентом для тестов жизненного цикла"""
+    _, data = api.make_request("POST", "/orders/", api.TEST_ORDER, user_type="client", ctx=ctx)
+    ctx.order_id = data["id"]
+    return data
+
+
+@pytest.fixture
+def disposable_order(ctx, client_token):
+    """ID нового заказа для теста, который меняет его состояние"""
+    _, data = api.make_request("POST", "/orders/", api.TEST_ORDER, user_type="client", ctx=ctx)
+    return data["id"]
+
+
+@pytest.fixture(scope="session")
+def extra_driver(ctx):
+    """Новый водитель с профилем транспорта: регистрация и вход один раз за прогон"""
+    # Случайный суффикс: параллельные прогоны не сталкиваются на email и телефоне
+    suffix = uuid.uuid4().hex[:10]
+    number = int(suffix, 16)
+    credentials = {
+        "username": f"testdriver{suffix}@example.com",
+        "password": "Driver123!"
+    }
+    new_driver = {
+        "email": credentials["username"],
+        "phone": f"+7998{number % 10000000:07d}",
+        "full_name": f"Test Driver {suffix}",
+        "role": "driver",
+        "password": credentials["password"]
+    }
+    api.make_request("POST", "/auth/register", new_driver, user_type=None, ctx=ctx)
+    login = api.ensure_login(ctx, credentials, "extra_driver")
+
+    profile_data = {
+        "vehicle_type": "Газель",
+        "vehicle_model": "ГАЗель Next",
+        "vehicle_number": f"А{number % 1000:03d}АА77",
+        "carrying_capacity": 1.5,
+        "volume": 10.0
+    }
+    _, profile = api.make_request("POST", "/drivers/profile", profile_data, user_type="extra_driver", ctx=ctx)
+    return {
+        "email": credentials["username"],
+        "token": login["access_token"],
+        "id": login["user"]["id"],
+        "profile": profile
+    }
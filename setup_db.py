@@ -5,321 +5,425 @@
 import sys
 import os
 import hashlib
+import itertools
+import sqlite3
 from datetime import datetime, timedelta
 import random
+from enum import Enum
+from functools import lru_cache
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app.database import SessionLocal, engine
-from app.models import Base
-from app import models
+# Префикс даты вычисляем один раз, счетчик гарантирует уникальность номеров
+_DATE_PREFIX = datetime.now().strftime('%Y%m%d')
+_order_seq = itertools.count(1001)
 
 def get_password_hash(password: str) -> str:
     """Хеширование пароля - SHA256"""
     return hashlib.sha256(password.encode()).hexdigest()
 
+def generate_order_number():
+    """Генерация номера заказа"""
+    return f"ORD{_DATE_PREFIX}{next(_order_seq):04d}"
+
+# Необязательные колонки заказа: в executemany у всех строк одинаковый набор ключей
+ORDER_OPTIONAL_COLUMNS = (
+    "driver_id", "final_price", "platform_fee", "order_amount",
+    "delivery_date", "completed_at"
+)
+
+def build_user_row(user, **columns):
+    """Строка таблицы users из тестовых данных пользователя"""
+    row = {
+        "email": user["email"],
+        "phone": user["phone"],
+        "full_name": user["name"],
+        "hashed_password": get_password_hash(user["password"])
+    }
+    row.update(columns)
+    return row
+
+def build_driver_row(user_id, driver, verification_status, lat=None, lng=None):
+    """Строка таблицы driver_profiles со случайными характеристиками"""
+    verified = driver["verified"]
+    return {
+        "user_id": user_id,
+        "vehicle_type": driver["vehicle"],
+        "vehicle_model": driver["model"],
+        "vehicle_number": driver["plate"],
+        "carrying_capacity": random.uniform(3.5, 20.0),
+        "volume": random.uniform(15.0, 90.0),
+        "verification_status": verification_status,
+        "rating": round(random.uniform(4.0, 5.0), 1),
+        "total_orders": random.randint(10, 50),
+        "total_distance": random.uniform(5000, 15000),
+        "is_online": verified,
+        "current_location_lat": lat if verified else None,
+        "current_location_lng": lng if verified else None
+    }
+
+def build_order_row(client_id, status, **fields):
+    """Строка таблицы orders с новым номером заказа"""
+    row = dict(get_order_defaults())
+    row.update(dict.fromkeys(ORDER_OPTIONAL_COLUMNS))
+    row.update(fields)
+    row["order_number"] = generate_order_number()
+    row["client_id"] = client_id
+    row["status"] = status
+    return row
+
+@lru_cache(maxsize=None)
+def get_metadata():
+    """Метаданные моделей (импорт приложения выполняется один раз)"""
+    from app.models import Base
+    return Base.metadata
+
+@lru_cache(maxsize=None)
+def get_order_defaults():
+    """Python-значения по умолчанию колонок orders (при вставке через DB-API их не подставит SQLAlchemy)"""
+    from app.models import Order
+    return {
+        column.name: column.default.arg
+        for column in Order.__table__.columns
+        if column.default is not None and column.default.is_scalar
+    }
+
+@lru_cache(maxsize=None)
+def get_schema_ddl(dialect):
+    """DDL всех таблиц и индексов одним скриптом (компилируется один раз)"""
+    from sqlalchemy.schema import CreateIndex, CreateTable
+    statements = []
+    # SQLite не проверяет внешние ключи при CREATE TABLE, порядок таблиц не важен
+    for table in get_metadata().tables.values():
+        statements.append(str(CreateTable(table).compile(dialect=dialect)).strip())
+        for index in table.indexes:
+            statements.append(str(CreateIndex(index).compile(dialect=dialect)).strip())
+    return ";\n".join(statements) + ";"
+
+def write_lines(lines):
+    """Вывод накопленных строк одной записью в stdout"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
 def create_database():
     """Создание базы данных с тестовыми данными"""
-    print("=" * 60)
-    print("🚀 Создание базы данных CargoPro")
-    print("=" * 60)
+    # Импорты приложения ленивые, чтобы не платить за них при импорте модуля
+    from app.database import engine
+    from app import models
+    from sqlalchemy import select
+    
+    # Весь вывод копим в буфере и пишем одним вызовом
+    out = []
+    out.append("=" * 60)
+    out.append("🚀 Создание базы данных CargoPro")
+    out.append("=" * 60)
     
     # Удаляем старую базу если есть
     db_file = "./cargopro.db"
     if os.path.exists(db_file):
-        print(f"🗑️  Удаление старой базы: {db_file}")
+        out.append(f"🗑️  Удаление старой базы: {db_file}")
         os.remove(db_file)
+        # Закрываем пул, иначе соединения продолжат ссылаться на удаленный файл
+        engine.dispose()
     
     # Создаем таблицы
-    print("📊 Создание таблиц...")
+    out.append("📊 Создание таблиц...")
     try:
-        Base.metadata.create_all(bind=engine)
-        print("✅ Таблицы созданы успешно")
+        if engine.dialect.name == "sqlite":
+            # datetime сериализует сам sqlite3 в формате SQLAlchemy, без Python type-процессора на каждую строку
+            # (адаптер глобален для процесса, поэтому регистрируется только при создании базы)
+            sqlite3.register_adapter(datetime, lambda d: d.isoformat(" ", "microseconds"))
+            # Файл базы только что удален, проверять существование таблиц незачем:
+            # вся схема одним executescript вместо отдельного запроса на каждую таблицу
+            raw_conn = engine.raw_connection()
+            try:
+                raw_conn.executescript(get_schema_ddl(engine.dialect))
+            finally:
+                raw_conn.close()
+        else:
+            # Здесь база не удалялась (схема могла быть создана миграциями), существующие таблицы пропускаем
+            get_metadata().create_all(bind=engine, checkfirst=True)
+        out.append("✅ Таблицы созданы успешно")
     except Exception as e:
-        print(f"❌ Ошибка создания таблиц: {e}")
+        out.append(f"❌ Ошибка создания таблиц: {e}")
+        write_lines(out)
         return
     
-    # Создаем сессию
-    db = SessionLocal()
+    # Тестовые пользователи
+    admin_data = {
+        "email": "admin@cargopro.com",
+        "phone": "+79991112233",
+        "name": "Администратор Системы",
+        "password": "Admin123!"
+    }
+    clients_data = [
+        {
+            "email": "client1@example.com",
+            "phone": "+79992223344",
+            "name": "Иван Иванов",
+            "password": "Client1!",
+            "balance": 50000.0
+        },
+        {
+            "email": "client2@example.com", 
+            "phone": "+79993334455",
+            "name": "Мария Петрова",
+            "password": "Client2!",
+            "balance": 75000.0
+        },
+        {
+            "email": "company@example.com",
+            "phone": "+74951234567",
+            "name": "ООО 'Грузовик'",
+            "password": "Company1!",
+            "balance": 150000.0
+        }
+    ]
+    drivers_data = [
+        {
+            "email": "driver1@example.com",
+            "phone": "+79994445566",
+            "name": "Алексей Водителев",
+            "password": "Driver1!",
+            "verified": True,
+            "vehicle": "Грузовик",
+            "model": "Mercedes Actros",
+            "plate": "А123ВС777"
+        },
+        {
+            "email": "driver2@example.com",
+            "phone": "+79995556677",
+            "name": "Дмитрий Шоферов",
+            "password": "Driver2!",
+            "verified": True,
+            "vehicle": "Фургон",
+            "model": "Ford Transit",
+            "plate": "В456ОР777"
+        },
+        {
+            "email": "driver3@example.com",
+            "phone": "+79996667788",
+            "name": "Сергей Грузовиков",
+            "password": "Driver3!",
+            "verified": False,
+            "vehicle": "Рефрижератор",
+            "model": "Volvo FH",
+            "plate": "С789ТУ777"
+        }
+    ]
     
     try:
-        # 1. СОЗДАЕМ АДМИНИСТРАТОРА
-        print("\n👑 Создание администратора...")
-        admin_password = "Admin123!"
-        admin_hash = get_password_hash(admin_password)
-        
-        admin_user = models.User(
-            email="admin@cargopro.com",
-            phone="+79991112233",
-            full_name="Администратор Системы",
-            role=models.UserRole.ADMIN,
-            is_active=True,
-            is_verified=True,
-            hashed_password=admin_hash,
-            balance=0.0
-        )
-        db.add(admin_user)
-        print(f"✅ Администратор: admin@cargopro.com / {admin_password}")
-        print(f"   Хэш пароля: {admin_hash[:30]}...")
-        
-        # 2. СОЗДАЕМ КЛИЕНТОВ
-        print("\n👥 Создание клиентов...")
-        clients_data = [
-            {
-                "email": "client1@example.com",
-                "phone": "+79992223344",
-                "name": "Иван Иванов",
-                "password": "Client1!",
-                "balance": 50000.0
-            },
-            {
-                "email": "client2@example.com", 
-                "phone": "+79993334455",
-                "name": "Мария Петрова",
-                "password": "Client2!",
-                "balance": 75000.0
-            },
-            {
-                "email": "company@example.com",
-                "phone": "+74951234567",
-                "name": "ООО 'Грузовик'",
-                "password": "Company1!",
-                "balance": 150000.0
-            }
-        ]
-        
-        clients = []
-        for client in clients_data:
-            user = models.User(
-                email=client["email"],
-                phone=client["phone"],
-                full_name=client["name"],
-                role=models.UserRole.CLIENT,
-                is_active=True,
-                is_verified=True,
-                hashed_password=get_password_hash(client["password"]),
-                balance=client["balance"]
-            )
-            db.add(user)
-            clients.append(user)
-            print(f"✅ Клиент: {client['email']} / {client['password']}")
-        
-        # 3. СОЗДАЕМ ВОДИТЕЛЕЙ
-        print("\n🚚 Создание водителей...")
-        drivers_data = [
-            {
-                "email": "driver1@example.com",
-                "phone": "+79994445566",
-                "name": "Алексей Водителев",
-                "password": "Driver1!",
-                "verified": True,
-                "vehicle": "Грузовик",
-                "model": "Mercedes Actros",
-                "plate": "А123ВС777"
-            },
-            {
-                "email": "driver2@example.com",
-                "phone": "+79995556677",
-                "name": "Дмитрий Шоферов",
-                "password": "Driver2!",
-                "verified": True,
-                "vehicle": "Фургон",
-                "model": "Ford Transit",
-                "plate": "В456ОР777"
-            },
-            {
-                "email": "driver3@example.com",
-                "phone": "+79996667788",
-                "name": "Сергей Грузовиков",
-                "password": "Driver3!",
-                "verified": False,
-                "vehicle": "Рефрижератор",
-                "model": "Volvo FH",
-                "plate": "С789ТУ777"
-            }
-        ]
-        
-        drivers = []
-        for driver in drivers_data:
-            # Пользователь-водитель
-            driver_user = models.User(
-                email=driver["email"],
-                phone=driver["phone"],
-                full_name=driver["name"],
-                role=models.UserRole.DRIVER,
-                is_active=True,
-                is_verified=driver["verified"],
-                hashed_password=get_password_hash(driver["password"]),
-                balance=25000.0
-            )
-            db.add(driver_user)
-            db.flush()  # Получаем ID
+        # Одна транзакция на Core-вставках, без ORM-сессии; при ошибке откатывается автоматически
+        with engine.begin() as conn:
+            # 1. СОЗДАЕМ ПОЛЬЗОВАТЕЛЕЙ
+            # Все пользователи одной вставкой; общие значения задаем через values()
+            users_rows = [
+                build_user_row(admin_data, role=models.UserRole.ADMIN, is_verified=True, balance=0.0)
+            ]
+            users_rows += [
+                build_user_row(client, role=models.UserRole.CLIENT, is_verified=True, balance=client["balance"])
+                for client in clients_data
+            ]
+            users_rows += [
+                build_user_row(driver, role=models.UserRole.DRIVER, is_verified=driver["verified"], balance=25000.0)
+                for driver in drivers_data
+            ]
+            users_table = models.User.__table__
+            if engine.dialect.name == "sqlite":
+                # В новой базе SQLite ID назначаем сами, чтобы сразу ссылаться на них из профилей и заказов
+                for user_id, row in enumerate(users_rows, start=1):
+                    row["id"] = user_id
+                conn.execute(users_table.insert().values(is_active=True), users_rows)
+            else:
+                # Явные ID не сдвигают последовательность SERIAL: ID выдает база, читаем их по email
+                conn.execute(users_table.insert().values(is_active=True), users_rows)
+                ids = dict(conn.execute(
+                    select(users_table.c.email, users_table.c.id)
+                    .where(users_table.c.email.in_([row["email"] for row in users_rows]))
+                ).all())
+                for row in users_rows:
+                    row["id"] = ids[row["email"]]
+            clients = [row["id"] for row in users_rows[1:1 + len(clients_data)]]
+            drivers = [row["id"] for row in users_rows[1 + len(clients_data):]]
             
-            # Профиль водителя
-            driver_profile = models.DriverProfile(
-                user_id=driver_user.id,
-                vehicle_type=driver["vehicle"],
-                vehicle_model=driver["model"],
-                vehicle_number=driver["plate"],
-                carrying_capacity=random.uniform(3.5, 20.0),
-                volume=random.uniform(15.0, 90.0),
-                verification_status=models.VerificationStatus.VERIFIED if driver["verified"] else models.VerificationStatus.PENDING,
-                rating=round(random.uniform(4.0, 5.0), 1),
-                total_orders=random.randint(10, 50),
-                total_distance=random.uniform(5000, 15000),
-                is_online=driver["verified"],
-                current_location_lat=55.7558 + random.uniform(-0.1, 0.1) if driver["verified"] else None,
-                current_location_lng=37.6173 + random.uniform(-0.1, 0.1) if driver["verified"] else None
-            )
-            db.add(driver_profile)
-            drivers.append(driver_user)
+            # 2. СОЗДАЕМ ПРОФИЛИ ВОДИТЕЛЕЙ
+            # Смещения координат от центра Москвы разыгрываем одним списком на всех водителей
+            n = len(drivers_data)
+            jitter = [random.uniform(-0.1, 0.1) for _ in range(2 * n)]
+            lats = [55.7558 + d for d in jitter[:n]]
+            lngs = [37.6173 + d for d in jitter[n:]]
+            conn.execute(models.DriverProfile.__table__.insert(), [
+                build_driver_row(
+                    drivers[i],
+                    driver,
+                    models.VerificationStatus.VERIFIED if driver["verified"] else models.VerificationStatus.PENDING,
+                    lats[i],
+                    lngs[i]
+                )
+                for i, driver in enumerate(drivers_data)
+            ])
             
-            status = "верифицирован ✅" if driver["verified"] else "ожидает верификации ⏳"
-            print(f"✅ Водитель: {driver['email']} / {driver['password']} ({status})")
-        
-        # 4. СОЗДАЕМ ЗАКАЗЫ
-        print("\n📦 Создание заказов...")
-        
-        # Генерация номера заказа
-        def generate_order_number():
-            return f"ORD{datetime.now().strftime('%Y%m%d')}{random.randint(1000, 9999)}"
-        
-        # Заказ 1: Поиск водителя
-        order1 = models.Order(
-            order_number=generate_order_number(),
-            client_id=clients[0].id,
-            status=models.OrderStatus.SEARCHING,
-            from_address="Москва, ул. Тверская, 1",
-            from_lat=55.7558,
-            from_lng=37.6173,
-            to_address="Санкт-Петербург, Невский проспект, 28",
-            to_lat=59.9343,
-            to_lng=30.3351,
-            distance_km=634.0,
-            cargo_description="Офисная мебель",
-            cargo_weight=2.5,
-            cargo_volume=12.0,
-            cargo_type="Мебель",
-            desired_price=35000.0,
-            pickup_date=datetime.utcnow() + timedelta(days=2)
-        )
-        db.add(order1)
-        print(f"✅ Заказ 1: {order1.order_number} (поиск водителя)")
-        
-        # Заказ 2: В пути
-        order2 = models.Order(
-            order_number=generate_order_number(),
-            client_id=clients[1].id,
-            driver_id=drivers[0].id,
-            status=models.OrderStatus.EN_ROUTE,
-            from_address="Екатеринбург, ул. Малышева, 51",
-            from_lat=56.8389,
-            from_lng=60.6057,
-            to_address="Челябинск, пр. Ленина, 54",
-            to_lat=55.1644,
-            to_lng=61.4368,
-            distance_km=198.0,
-            cargo_description="Промышленное оборудование",
-            cargo_weight=15.0,
-            cargo_volume=60.0,
-            cargo_type="Оборудование",
-            desired_price=85000.0,
-            final_price=82000.0,
-            platform_fee=4100.0,
-            order_amount=77900.0,
-            payment_status=models.PaymentStatus.COMPLETED,
-            pickup_date=datetime.utcnow() - timedelta(hours=12),
-            delivery_date=datetime.utcnow() + timedelta(hours=36)
-        )
-        db.add(order2)
-        print(f"✅ Заказ 2: {order2.order_number} (в пути)")
-        
-        # Заказ 3: Завершен
-        order3 = models.Order(
-            order_number=generate_order_number(),
-            client_id=clients[2].id,
-            driver_id=drivers[1].id,
-            status=models.OrderStatus.COMPLETED,
-            from_address="Новосибирск, Красный проспект, 28",
-            from_lat=55.0302,
-            from_lng=82.9204,
-            to_address="Кемерово, ул. Весенняя, 15",
-            to_lat=55.3547,
-            to_lng=86.0863,
-            distance_km=248.0,
-            cargo_description="Строительные материалы",
-            cargo_weight=25.0,
-            cargo_volume=90.0,
-            cargo_type="Строительные материалы",
-            desired_price=120000.0,
-            final_price=115000.0,
-            platform_fee=5750.0,
-            order_amount=109250.0,
-            payment_status=models.PaymentStatus.COMPLETED,
-            pickup_date=datetime.utcnow() - timedelta(days=3),
-            delivery_date=datetime.utcnow() - timedelta(days=1),
-            completed_at=datetime.utcnow() - timedelta(days=1)
-        )
-        db.add(order3)
-        print(f"✅ Заказ 3: {order3.order_number} (завершен)")
-        
-        # Сохраняем все изменения
-        db.commit()
-        
-        print("\n" + "=" * 60)
-        print("🎉 БАЗА ДАННЫХ УСПЕШНО СОЗДАНА!")
-        print("=" * 60)
-        
-        print("\n📋 УЧЕТНЫЕ ЗАПИСИ ДЛЯ ТЕСТИРОВАНИЯ:")
-        print("-" * 50)
-        print("👑 АДМИНИСТРАТОР (админ-панель):")
-        print(f"  Email:    admin@cargopro.com")
-        print(f"  Пароль:   Admin123!")
-        print()
-        print("👥 КЛИЕНТЫ (сайт/приложение):")
-        print(f"  1. Email:    client1@example.com")
-        print(f"     Пароль:   Client1!")
-        print(f"     Баланс:   50 000 ₽")
-        print()
-        print(f"  2. Email:    client2@example.com")
-        print(f"     Пароль:   Client2!")
-        print(f"     Баланс:   75 000 ₽")
-        print()
-        print(f"  3. Email:    company@example.com")
-        print(f"     Пароль:   Company1!")
-        print(f"     Баланс:   150 000 ₽")
-        print()
-        print("🚚 ВОДИТЕЛИ (мобильное приложение):")
-        print(f"  1. Email:    driver1@example.com")
-        print(f"     Пароль:   Driver1!")
-        print(f"     Статус:   верифицирован ✅")
-        print()
-        print(f"  2. Email:    driver2@example.com")
-        print(f"     Пароль:   Driver2!")
-        print(f"     Статус:   верифицирован ✅")
-        print()
-        print(f"  3. Email:    driver3@example.com")
-        print(f"     Пароль:   Driver3!")
-        print(f"     Статус:   ожидает верификации ⏳")
-        print("-" * 50)
-        
-        print("\n🚀 СЛЕДУЮЩИЕ ШАГИ:")
-        print("1. Запустите сервер: python run.py")
-        print("2. Откройте API документацию: http://localhost:8000/api/docs")
-        print("3. Запустите фронтенд (админ-панель)")
-        print("4. Войдите с данными администратора")
-        print("\n⚡ Тестирование через curl:")
-        print('curl -X POST http://localhost:8000/api/auth/login \\')
-        print('  -H "Content-Type: application/x-www-form-urlencoded" \\')
-        print('  -d "username=admin@cargopro.com&password=Admin123!"')
-        
+            # 3. СОЗДАЕМ ЗАКАЗЫ
+            orders_data = [
+                # Заказ 1: Поиск водителя
+                build_order_row(
+                    clients[0],
+                    models.OrderStatus.SEARCHING,
+                    from_address="Москва, ул. Тверская, 1",
+                    from_lat=55.7558,
+                    from_lng=37.6173,
+                    to_address="Санкт-Петербург, Невский проспект, 28",
+                    to_lat=59.9343,
+                    to_lng=30.3351,
+                    distance_km=634.0,
+                    cargo_description="Офисная мебель",
+                    cargo_weight=2.5,
+                    cargo_volume=12.0,
+                    cargo_type="Мебель",
+                    desired_price=35000.0,
+                    pickup_date=datetime.utcnow() + timedelta(days=2)
+                ),
+                # Заказ 2: В пути
+                build_order_row(
+                    clients[1],
+                    models.OrderStatus.EN_ROUTE,
+                    driver_id=drivers[0],
+                    from_address="Екатеринбург, ул. Малышева, 51",
+                    from_lat=56.8389,
+                    from_lng=60.6057,
+                    to_address="Челябинск, пр. Ленина, 54",
+                    to_lat=55.1644,
+                    to_lng=61.4368,
+                    distance_km=198.0,
+                    cargo_description="Промышленное оборудование",
+                    cargo_weight=15.0,
+                    cargo_volume=60.0,
+                    cargo_type="Оборудование",
+                    desired_price=85000.0,
+                    final_price=82000.0,
+                    platform_fee=4100.0,
+                    order_amount=77900.0,
+                    payment_status=models.PaymentStatus.COMPLETED,
+                    pickup_date=datetime.utcnow() - timedelta(hours=12),
+                    delivery_date=datetime.utcnow() + timedelta(hours=36)
+                ),
+                # Заказ 3: Завершен
+                build_order_row(
+                    clients[2],
+                    models.OrderStatus.COMPLETED,
+                    driver_id=drivers[1],
+                    from_address="Новосибирск, Красный проспект, 28",
+                    from_lat=55.0302,
+                    from_lng=82.9204,
+                    to_address="Кемерово, ул. Весенняя, 15",
+                    to_lat=55.3547,
+                    to_lng=86.0863,
+                    distance_km=248.0,
+                    cargo_description="Строительные материалы",
+                    cargo_weight=25.0,
+                    cargo_volume=90.0,
+                    cargo_type="Строительные материалы",
+                    desired_price=120000.0,
+                    final_price=115000.0,
+                    platform_fee=5750.0,
+                    order_amount=109250.0,
+                    payment_status=models.PaymentStatus.COMPLETED,
+                    pickup_date=datetime.utcnow() - timedelta(days=3),
+                    delivery_date=datetime.utcnow() - timedelta(days=1),
+                    completed_at=datetime.utcnow() - timedelta(days=1)
+                )
+            ]
+            if engine.dialect.name == "sqlite":
+                # Напрямую через DB-API, чтобы datetime обработал адаптер sqlite3;
+                # Enum SQLAlchemy хранит по имени члена
+                columns = list(orders_data[0])
+                # Как и Core-вставка, не теряем молча ключи, которых нет в первой строке
+                for row in orders_data:
+                    if row.keys() != orders_data[0].keys():
+                        raise ValueError(f"Order row columns differ: {sorted(row.keys() ^ orders_data[0].keys())}")
+                conn.exec_driver_sql(
+                    f"INSERT INTO orders ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                    [
+                        tuple(row[c].name if isinstance(row[c], Enum) else row[c] for c in columns)
+                        for row in orders_data
+                    ]
+                )
+            else:
+                conn.execute(models.Order.__table__.insert(), orders_data)
     except Exception as e:
-        print(f"\n❌ ОШИБКА ПРИ СОЗДАНИИ БАЗЫ ДАННЫХ: {e}")
+        out.append(f"\n❌ ОШИБКА ПРИ СОЗДАНИИ БАЗЫ ДАННЫХ: {e}")
+        write_lines(out)
         import traceback
         traceback.print_exc()
-        db.rollback()
-    finally:
-        db.close()
+        return
+    
+    # Вывод формируем уже после commit, чтобы не держать блокировку SQLite на время I/O
+    out.append("\n👑 Создание администратора...")
+    out.append(f"✅ Администратор: {admin_data['email']} / {admin_data['password']}")
+    out.append(f"   Хэш пароля: {users_rows[0]['hashed_password'][:30]}...")
+    
+    out.append("\n👥 Создание клиентов...")
+    for client in clients_data:
+        out.append(f"✅ Клиент: {client['email']} / {client['password']}")
+    
+    out.append("\n🚚 Создание водителей...")
+    for driver in drivers_data:
+        status = "верифицирован ✅" if driver["verified"] else "ожидает верификации ⏳"
+        out.append(f"✅ Водитель: {driver['email']} / {driver['password']} ({status})")
+    
+    out.append("\n📦 Создание заказов...")
+    out.append(f"✅ Заказ 1: {orders_data[0]['order_number']} (поиск водителя)")
+    out.append(f"✅ Заказ 2: {orders_data[1]['order_number']} (в пути)")
+    out.append(f"✅ Заказ 3: {orders_data[2]['order_number']} (завершен)")
+    
+    out.append("\n" + "=" * 60)
+    out.append("🎉 БАЗА ДАННЫХ УСПЕШНО СОЗДАНА!")
+    out.append("=" * 60)
+    
+    out.append("\n📋 УЧЕТНЫЕ ЗАПИСИ ДЛЯ ТЕСТИРОВАНИЯ:")
+    out.append("-" * 50)
+    out.append("👑 АДМИНИСТРАТОР (админ-панель):")
+    out.append(f"  Email:    admin@cargopro.com")
+    out.append(f"  Пароль:   Admin123!")
+    out.append("")
+    out.append("👥 КЛИЕНТЫ (сайт/приложение):")
+    out.append(f"  1. Email:    client1@example.com")
+    out.append(f"     Пароль:   Client1!")
+    out.append(f"     Баланс:   50 000 ₽")
+    out.append("")
+    out.append(f"  2. Email:    client2@example.com")
+    out.append(f"     Пароль:   Client2!")
+    out.append(f"     Баланс:   75 000 ₽")
+    out.append("")
+    out.append(f"  3. Email:    company@example.com")
+    out.append(f"     Пароль:   Company1!")
+    out.append(f"     Баланс:   150 000 ₽")
+    out.append("")
+    out.append("🚚 ВОДИТЕЛИ (мобильное приложение):")
+    out.append(f"  1. Email:    driver1@example.com")
+    out.append(f"     Пароль:   Driver1!")
+    out.append(f"     Статус:   верифицирован ✅")
+    out.append("")
+    out.append(f"  2. Email:    driver2@example.com")
+    out.append(f"     Пароль:   Driver2!")
+    out.append(f"     Статус:   верифицирован ✅")
+    out.append("")
+    out.append(f"  3. Email:    driver3@example.com")
+    out.append(f"     Пароль:   Driver3!")
+    out.append(f"     Статус:   ожидает верификации ⏳")
+    out.append("-" * 50)
+    
+    out.append("\n🚀 СЛЕДУЮЩИЕ ШАГИ:")
+    out.append("1. Запустите сервер: python run.py")
+    out.append("2. Откройте API документацию: http://localhost:8000/api/docs")
+    out.append("3. Запустите фронтенд (админ-панель)")
+    out.append("4. Войдите с данными администратора")
+    out.append("\n⚡ Тестирование через curl:")
+    out.append('curl -X POST http://localhost:8000/api/auth/login \\')
+    out.append('  -H "Content-Type: application/x-www-form-urlencoded" \\')
+    out.append('  -d "username=admin@cargopro.com&password=Admin123!"')
+    
+    write_lines(out)
 
 if __name__ == "__main__":
     create_database()
\ No newline at end of file
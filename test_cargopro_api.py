@@ -2,23 +2,79 @@
 """
 Тесты для проверки всех эндпоинтов CargoPro API
 IP адрес: 192.168.10.102
+
+Запуск: python test_cargopro_api.py (pytest с итоговым отчетом и порогом успешности 80%)
+или параллельно: pytest -n auto --dist loadgroup test_cargopro_api.py
+(тесты, меняющие данные, помечены xdist_group("writes") и идут на одном воркере)
 """
 
+import asyncio
+import hashlib
+import orjson
+import pytest
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-import time
 import os
 import sys
+import uuid
+from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
+from typing import Optional
+from types import MappingProxyType
 import logging
 
-# Настройка логгера
+# Настройка логгера: подробности тестов выводятся только с VERBOSE=1,
+# отчет о прогоне (report) - всегда
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO if os.getenv("VERBOSE") else logging.WARNING)
+report = logging.getLogger(f"{__name__}.report")
+report.setLevel(logging.INFO)
+
+_BANNER = "=" * 80
 
 # Конфигурация
 BASE_URL = "http://192.168.10.102:8000"
 API_URL = f"{BASE_URL}/api"
+AUTH_LOGIN_URL = f"{API_URL}/auth/login"
+AUTH_REFRESH_URL = f"{API_URL}/auth/refresh"
+
+# Файловый кэш расчетов стоимости между прогонами, по умолчанию выключен (disabled), чтобы
+# test_calculate_price проверял сервер; enabled - ответ берется из кэша, replay - только из кэша
+# (промах - ошибка)
+PRICE_CACHE_MODE = os.environ.get("PRICE_CACHE_MODE", "disabled")
+PRICE_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "price.json")
+
+# Общая HTTP-сессия: соединение с сервером переиспользуется всеми тестами
+SESSION = requests.Session()
+SESSION.headers["Content-Type"] = "application/json"
+# Пул соединений рассчитан на параллельный запуск (pytest-xdist задает PYTEST_XDIST_WORKER_COUNT),
+# обрывы соединения и временные 429/5xx повторяются внутри urllib3 с экспоненциальной паузой.
+# Методы - набор urllib3 по умолчанию (идемпотентные): повтор POST после того, как сервер
+# его уже выполнил, создал бы второй заказ или вернул ложную 400.
+# Ошибка подключения повторяется один раз: недоступный сервер обнаруживается сразу
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "8")) * 2,
+    max_retries=Retry(
+        total=4,
+        connect=1,
+        backoff_factor=0.3,
+        status_forcelist=(429, 502, 503, 504),
+        respect_retry_after_header=True
+    )
+))
+
+# HTTP-методы, которые поддерживает make_request (вызываются для сессии контекста)
+_DISPATCH = {
+    "GET": requests.Session.get,
+    "POST": requests.Session.post,
+    "PUT": requests.Session.put,
+    "DELETE": requests.Session.delete
+}
 
 # Тестовые данные
 TEST_ADMIN = {
@@ -36,316 +92,319 @@ TEST_DRIVER = {
     "password": "Driver123!"
 }
 
-# Глобальные переменные для хранения токенов и ID
-tokens = {}
-user_ids = {}
-order_id = None
-bid_id = None
+# Заказ Москва - Санкт-Петербург для тестов заказов
+TEST_ORDER = {
+    "from_address": "Москва, Ленинский проспект, 32",
+    "from_lat": 55.6911,
+    "from_lng": 37.5734,
+    "to_address": "Санкт-Петербург, Невский проспект, 28",
+    "to_lat": 59.9343,
+    "to_lng": 30.3351,
+    "cargo_description": "Тестовый груз для проверки API",
+    "cargo_weight": 2.5,
+    "cargo_volume": 12.0,
+    "cargo_type": "Оборудование",
+    "desired_price": 35000.0
+}
+
+# Роли и учетные данные для входа
+LOGIN_CASES = [("admin", TEST_ADMIN), ("client", TEST_CLIENT), ("driver", TEST_DRIVER)]
+
+# Параметры для проверки формы списков: достаточно одной записи, чтобы убедиться,
+# что ответ - массив, без передачи и разбора всей таблицы (limit есть у PaginationParams)
+LIST_PROBE = {"limit": 1}
+
+# Служебные эндпоинты (без префикса /api) и обязательный ключ в ответе
+HEALTH_CASES = [
+    ("/", "message"),
+    ("/health", "status"),
+    ("/health/detailed", "status"),
+    ("/health/database", "status"),
+    ("/metrics", "timestamp")
+]
+
+@dataclass(slots=True)
+class TestContext:
+    """Состояние прогона: токены, заголовки и ID вошедших пользователей, созданный заказ, HTTP-сессия"""
+    __test__ = False  # не тестовый класс для pytest
+    
+    tokens: dict = field(default_factory=dict)
+    # Готовые заголовки по ролям: собираются один раз при входе и не изменяются
+    # (Content-Type задан в SESSION.headers)
+    headers: dict = field(default_factory=dict)
+    user_ids: dict = field(default_factory=dict)
+    order_id: Optional[int] = None
+    session: Optional[requests.Session] = None
+
+# Контекст прогона по умолчанию (токены, заголовки и ID заполняет login_user)
+CONTEXT = TestContext(session=SESSION)
+
+_UNAUTH_HEADERS = MappingProxyType({})
+
+# Сколько символов тела ответа попадает в сообщения об ошибках
+ERROR_BODY_LIMIT = 512
 
 # Вспомогательные функции
-def get_auth_headers(user_type="admin"):
+def _status_error(response, expected_status):
+    """Ошибка о неожиданном коде ответа; тело ответа декодируется только здесь"""
+    return AssertionError("Expected %s, got %d: %s" % (
+        expected_status, response.status_code, response.text[:ERROR_BODY_LIMIT]
+    ))
+
+def _json(response):
+    """Разбор JSON-ответа через orjson (быстрее response.json() на больших списках)"""
+    return orjson.loads(response.content)
+
+def get_auth_headers(user_type="admin", ctx=CONTEXT):
     """Получение заголовков с токеном авторизации"""
-    token = tokens.get(user_type)
-    if not token:
-        return {}
-    return {"Authorization": f"Bearer {token}"}
+    return ctx.headers.get(user_type, _UNAUTH_HEADERS)
+
+@lru_cache(maxsize=64)
+def _abs(endpoint):
+    """Полный URL эндпоинта API (строится один раз на эндпоинт)"""
+    return API_URL + endpoint
 
-def make_request(method, endpoint, data=None, headers=None, user_type="admin", expected_status=200):
-    """Универсальная функция для выполнения запросов"""
-    url = f"{API_URL}{endpoint}"
+def make_request(method, endpoint, data=None, headers=None, user_type="admin", expected_status=200, ctx=CONTEXT):
+    """Универсальная функция для выполнения запросов, возвращает (код ответа, разобранный JSON)"""
+    url = _abs(endpoint)
+    # Допустимым может быть и несколько кодов ответа
+    expected = expected_status if isinstance(expected_status, tuple) else (expected_status,)
+    
+    try:
+        send = _DISPATCH[method]
+    except KeyError:
+        raise ValueError(f"Unsupported method: {method}") from None
     
+    # Заголовки вызывающего requests объединяет с SESSION.headers, не изменяя их
     if headers is None:
-        headers = get_auth_headers(user_type)
+        headers = get_auth_headers(user_type, ctx)
     
-    if data and method in ["POST", "PUT"]:
-        headers["Content-Type"] = "application/json"
+    response = send(
+        ctx.session,
+        url,
+        json=data if method != "GET" else None,
+        params=data if method == "GET" else None,
+        headers=headers
+    )
     
-    logger.info(f"Making {method} request to {endpoint}")
+    # Успешные запросы не логируются: одна строка только при ошибке
+    if response.status_code not in expected:
+        # Явное исключение вместо assert: проверка работает и под python -O
+        error = _status_error(response, expected_status)
+        logger.error("%s %s -> %s", method, endpoint, error)
+        raise error
     
-    try:
-        if method == "GET":
-            if data:
-                response = requests.get(url, headers=headers, params=data)
-            else:
-                response = requests.get(url, headers=headers)
-        elif method == "POST":
-            response = requests.post(url, json=data, headers=headers)
-        elif method == "PUT":
-            response = requests.put(url, json=data, headers=headers)
-        elif method == "DELETE":
-            response = requests.delete(url, headers=headers)
-        else:
-            raise ValueError(f"Unsupported method: {method}")
-        
-        logger.info(f"Response status: {response.status_code}")
-        
-        if response.status_code != expected_status:
-            logger.error(f"Request failed: {response.status_code} - {response.text}")
-        
-        assert response.status_code == expected_status, f"Expected {expected_status}, got {response.status_code}: {response.text}"
-        
-        return response
-    except Exception as e:
-        logger.error(f"Request error: {e}")
-        raise
+    # Тело разбираем один раз, тестам не нужно повторно разбирать ответ
+    return response.status_code, _json(response) if response.content else None
 
-def login_user(user_data, user_type):
-    """Вход пользователя"""
-    response = requests.post(f"{API_URL}/auth/login", 
-                           data=user_data,
-                           headers={"Content-Type": "application/x-www-form-urlencoded"})
+def _remember_login(ctx, data, user_type):
+    """Сохранение токена, заголовков и ID вошедшего пользователя в контексте"""
+    ctx.tokens[user_type] = data["access_token"]
+    # Только для чтения: один и тот же объект передается во все запросы роли
+    ctx.headers[user_type] = MappingProxyType({"Authorization": f"Bearer {data['access_token']}"})
+    ctx.user_ids[user_type] = data["user"]["id"]
+
+def login_user(ctx, user_data, user_type):
+    """Вход пользователя в контексте ctx"""
+    response = ctx.session.post(AUTH_LOGIN_URL, 
+                          data=user_data,
+                          headers={"Content-Type": "application/x-www-form-urlencoded"})
     
     if response.status_code == 200:
-        data = response.json()
-        tokens[user_type] = data["access_token"]
-        user_ids[user_type] = data["user"]["id"]
-        logger.info(f"{user_type.capitalize()} logged in: {user_data['username']}")
-        return True
+        data = _json(response)
+        _remember_login(ctx, data, user_type)
+        logger.info("%s logged in: %s", user_type.capitalize(), user_data['username'])
+        return data
     else:
-        logger.error(f"Login failed for {user_type}: {response.status_code} - {response.text}")
-        return False
+        logger.error("Login failed for %s: %s", user_type, _status_error(response, 200))
+        return None
+
+def _load_price_cache():
+    """Содержимое файлового кэша расчетов стоимости"""
+    try:
+        with open(PRICE_CACHE_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+def calculate_price(calc_data, ctx=CONTEXT):
+    """Расчет стоимости перевозки; при PRICE_CACHE_MODE=enabled/replay ответ берется из файлового кэша"""
+    if PRICE_CACHE_MODE == "disabled":
+        _, data = make_request("POST", "/orders/calculate-price", calc_data, user_type="client", ctx=ctx)
+        return data
+    
+    # В ключе и адрес сервера: ответ другого сервера не подставляется
+    key = hashlib.sha256(API_URL.encode() + orjson.dumps(calc_data, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    cache = _load_price_cache()
+    if key in cache:
+        return cache[key]
+    if PRICE_CACHE_MODE == "replay":
+        raise RuntimeError(f"PRICE_CACHE_MODE=replay: no cached price for {calc_data}")
+    
+    _, data = make_request("POST", "/orders/calculate-price", calc_data, user_type="client", ctx=ctx)
+    cache[key] = data
+    os.makedirs(os.path.dirname(PRICE_CACHE_FILE), exist_ok=True)
+    # Запись через временный файл: параллельные воркеры не увидят файл наполовину
+    tmp_path = f"{PRICE_CACHE_FILE}.{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(cache))
+    os.replace(tmp_path, PRICE_CACHE_FILE)
+    return data
+
+def ensure_login(ctx, user_data, user_type):
+    """Вход пользователя с ошибкой, если он не удался"""
+    data = login_user(ctx, user_data, user_type)
+    assert data, f"Login failed for {user_type}"
+    return data
+
+# Все тесты модуля обращаются к серверу: его доступность проверяется до первого из них
+pytestmark = pytest.mark.usefixtures("server_available")
 
 # Основные тесты
 class TestAuthAPI:
     """Тесты для эндпоинтов аутентификации"""
     
-    def test_health_check(self):
+    @pytest.mark.parametrize("endpoint,key", HEALTH_CASES)
+    def test_health_check(self, endpoint, key, http_session):
         """Тест проверки здоровья API"""
-        response = requests.get(BASE_URL)
+        response = http_session.get(f"{BASE_URL}{endpoint}")
         assert response.status_code == 200
-        data = response.json()
-        assert "message" in data
-        logger.info(f"Health check: {data['message']}")
-        return True
+        data = _json(response)
+        assert key in data
+        logger.info("Health check %s: %s", endpoint, data[key])
     
-    def test_register_new_user(self):
+    @pytest.mark.xdist_group("writes")
+    def test_register_new_user(self, ctx):
         """Тест регистрации нового пользователя"""
-        timestamp = int(time.time())
+        suffix = uuid.uuid4().hex[:10]
         new_user = {
-            "email": f"testuser{timestamp}@example.com",
-            "phone": f"+7999{timestamp % 10000000:07d}",
-            "full_name": f"Test User {timestamp}",
+            "email": f"testuser{suffix}@example.com",
+            "phone": f"+7999{int(suffix, 16) % 10000000:07d}",
+            "full_name": f"Test User {suffix}",
             "role": "client",
             "password": "Test123!"
         }
         
-        response = requests.post(f"{API_URL}/auth/register", json=new_user)
-        
-        if response.status_code in [200, 400]:
-            # 400 - пользователь уже существует, это тоже нормально для тестов
-            logger.info(f"User registration attempt: {response.status_code}")
-            return True
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert "email" in data
-        logger.info(f"New user registered: {data['email']}")
-        return True
-    
-    def test_login_admin(self):
-        """Тест входа администратора"""
-        return login_user(TEST_ADMIN, "admin")
+        # 400 - пользователь уже существует, это тоже нормально для тестов
+        status, _ = make_request("POST", "/auth/register", new_user, user_type=None, expected_status=(200, 400), ctx=ctx)
+        logger.info("User registration attempt: %s", status)
     
-    def test_login_client(self):
-        """Тест входа клиента"""
-        return login_user(TEST_CLIENT, "client")
+    @pytest.mark.parametrize("role,creds", LOGIN_CASES, ids=[role for role, _ in LOGIN_CASES])
+    def test_login(self, role, creds, request):
+        """Тест входа администратора, клиента и водителя"""
+        data = request.getfixturevalue(f"{role}_login")
+        assert "access_token" in data
+        assert data["user"]["email"] == creds["username"]
     
-    def test_login_driver(self):
-        """Тест входа водителя"""
-        return login_user(TEST_DRIVER, "driver")
-    
-    def test_get_current_user(self):
+    def test_get_current_user(self, ctx, admin_token):
         """Тест получения информации о текущем пользователе"""
-        response = make_request("GET", "/auth/me", user_type="admin")
-        data = response.json()
+        _, data = make_request("GET", "/auth/me", user_type="admin", ctx=ctx)
         assert "email" in data
         assert data["email"] == TEST_ADMIN["username"]
-        logger.info(f"Current user: {data['email']}")
-        return True
+        logger.info("Current user: %s", data['email'])
     
-    def test_refresh_token(self):
+    def test_refresh_token(self, admin_login, http_session):
         """Тест обновления токена"""
-        # Сначала получаем refresh токен
-        login_response = requests.post(f"{API_URL}/auth/login", 
-                                     data=TEST_ADMIN,
-                                     headers={"Content-Type": "application/x-www-form-urlencoded"})
-        
-        if login_response.status_code != 200:
-            logger.warning("Skipping refresh token test - login failed")
-            return True
-        
-        refresh_token = login_response.json()["refresh_token"]
-        
-        response = requests.post(f"{API_URL}/auth/refresh", 
-                               json={"refresh_token": refresh_token})
+        # refresh токен уже получен при входе администратора
+        response = http_session.post(AUTH_REFRESH_URL, 
+                                   json={"refresh_token": admin_login["refresh_token"]})
         
         if response.status_code == 200:
-            data = response.json()
+            data = _json(response)
             assert "access_token" in data
             logger.info("Token refreshed successfully")
         else:
-            logger.warning(f"Refresh token test failed: {response.status_code}")
-        
-        return True
+            logger.warning("Refresh token test failed: %s", response.status_code)
 
 class TestUsersAPI:
     """Тесты для эндпоинтов пользователей"""
     
-    def test_get_user_profile(self):
+    def test_get_user_profile(self, ctx, client_token):
         """Тест получения профиля пользователя"""
-        if not tokens.get("client"):
-            logger.warning("Skipping test - client not logged in")
-            return True
-        
-        response = make_request("GET", "/users/me", user_type="client")
-        data = response.json()
+        _, data = make_request("GET", "/users/me", user_type="client", ctx=ctx)
         assert "email" in data
         assert data["email"] == TEST_CLIENT["username"]
-        logger.info(f"User profile retrieved: {data['email']}")
-        return True
+        logger.info("User profile retrieved: %s", data['email'])
     
-    def test_update_user_profile(self):
+    @pytest.mark.xdist_group("writes")
+    def test_update_user_profile(self, ctx, client_token):
         """Тест обновления профиля пользователя"""
-        if not tokens.get("client"):
-            logger.warning("Skipping test - client not logged in")
-            return True
-        
         update_data = {
             "full_name": "Updated Test User",
             "phone": "+79991112233"
         }
         
-        response = make_request("PUT", "/users/me", update_data, user_type="client")
-        data = response.json()
+        _, data = make_request("PUT", "/users/me", update_data, user_type="client", ctx=ctx)
         assert data["full_name"] == update_data["full_name"]
-        logger.info(f"User profile updated: {data['full_name']}")
-        return True
+        logger.info("User profile updated: %s", data['full_name'])
     
-    def test_get_all_users_admin(self):
+    def test_get_all_users_admin(self, ctx, admin_token):
         """Тест получения списка пользователей (только админ)"""
-        if not tokens.get("admin"):
-            logger.warning("Skipping test - admin not logged in")
-            return True
-        
-        response = make_request("GET", "/users/", user_type="admin")
-        data = response.json()
+        _, data = make_request("GET", "/users/", LIST_PROBE, user_type="admin", ctx=ctx)
         assert isinstance(data, list)
-        logger.info(f"Retrieved {len(data)} users")
-        return True
+        logger.info("Users list OK (%s shown)", len(data))
     
-    def test_get_user_by_id(self):
+    def test_get_user_by_id(self, ctx, admin_token, client_login):
         """Тест получения пользователя по ID (только админ)"""
-        if not tokens.get("admin") or not user_ids.get("client"):
-            logger.warning("Skipping test - admin or client ID not available")
-            return True
-        
-        response = make_request("GET", f"/users/{user_ids['client']}", user_type="admin")
-        data = response.json()
-        assert data["id"] == user_ids["client"]
-        logger.info(f"User retrieved by ID: {data['email']}")
-        return True
+        client_id = ctx.user_ids["client"]
+        _, data = make_request("GET", f"/users/{client_id}", user_type="admin", ctx=ctx)
+        assert data["id"] == client_id
+        logger.info("User retrieved by ID: %s", data['email'])
     
-    def test_get_user_balance(self):
+    def test_get_user_balance(self, ctx, client_token):
         """Тест получения баланса пользователя"""
-        if not tokens.get("client"):
-            logger.warning("Skipping test - client not logged in")
-            return True
-        
-        response = make_request("GET", "/users/me/balance", user_type="client")
-        data = response.json()
+        _, data = make_request("GET", "/users/me/balance", user_type="client", ctx=ctx)
         assert "balance" in data
-        logger.info(f"User balance: {data['balance']}")
-        return True
+        logger.info("User balance: %s", data['balance'])
 
 class TestOrdersAPI:
     """Тесты для эндпоинтов заказов"""
     
-    def test_create_order(self):
+    @pytest.mark.xdist_group("writes")
+    def test_create_order(self, created_order):
         """Тест создания нового заказа"""
-        global order_id
-        
-        if not tokens.get("client"):
-            logger.warning("Skipping test - client not logged in")
-            return True
+        assert "order_number" in created_order
+        assert "id" in created_order
         
-        order_data = {
-            "from_address": "Москва, Ленинский проспект, 32",
-            "from_lat": 55.6911,
-            "from_lng": 37.5734,
-            "to_address": "Санкт-Петербург, Невский проспект, 28",
-            "to_lat": 59.9343,
-            "to_lng": 30.3351,
-            "cargo_description": "Тестовый груз для проверки API",
-            "cargo_weight": 2.5,
-            "cargo_volume": 12.0,
-            "cargo_type": "Оборудование",
-            "desired_price": 35000.0
-        }
-        
-        response = make_request("POST", "/orders/", order_data, user_type="client")
-        data = response.json()
-        
-        assert "order_number" in data
-        assert "id" in data
-        order_id = data["id"]
-        
-        logger.info(f"Order created: {data['order_number']} (ID: {order_id})")
-        return True
+        logger.info("Order created: %s (ID: %s)", created_order['order_number'], created_order['id'])
     
-    def test_get_my_orders(self):
+    def test_get_my_orders(self, ctx, client_token):
         """Тест получения списка заказов пользователя"""
-        if not tokens.get("client"):
-            logger.warning("Skipping test - client not logged in")
-            return True
-        
-        response = make_request("GET", "/orders/", user_type="client")
-        data = response.json()
+        _, data = make_request("GET", "/orders/", LIST_PROBE, user_type="client", ctx=ctx)
         assert isinstance(data, list)
-        logger.info(f"Retrieved {len(data)} orders for client")
-        return True
-    
-    def test_get_order_by_id(self):
-        """Тест получения заказа по ID"""
-        if not tokens.get("client") or not order_id:
-            logger.warning("Skipping test - client not logged in or no order created")
-            return True
-        
-        response = make_request("GET", f"/orders/{order_id}", user_type="client")
-        data = response.json()
+        logger.info("Client orders list OK (%s shown)", len(data))
+    
+    @pytest.mark.xdist_group("writes")
+    @pytest.mark.asyncio
+    async def test_get_order_by_id(self, ctx, created_order):
+        """Тест получения заказа по ID и его появления в списке заказов клиента"""
+        order_id = ctx.order_id
+        # Чтения после создания заказа независимы: идут одновременно через пул общей сессии
+        (_, data), (_, my_orders) = await asyncio.gather(
+            asyncio.to_thread(make_request, "GET", f"/orders/{order_id}", user_type="client", ctx=ctx),
+            asyncio.to_thread(make_request, "GET", "/orders/", user_type="client", ctx=ctx)
+        )
         assert data["id"] == order_id
-        logger.info(f"Order retrieved: {data['order_number']}")
-        return True
+        # Номер заказа уже известен из фикстуры, повторно его не запрашиваем
+        assert data["order_number"] == created_order["order_number"]
+        assert any(order["id"] == order_id for order in my_orders)
+        logger.info("Order retrieved: %s", data['order_number'])
     
-    def test_publish_order(self):
+    @pytest.mark.xdist_group("writes")
+    def test_publish_order(self, ctx, created_order):
         """Тест публикации заказа"""
-        if not tokens.get("client") or not order_id:
-            logger.warning("Skipping test - client not logged in or no order created")
-            return True
-        
-        response = make_request("POST", f"/orders/{order_id}/publish", user_type="client")
-        data = response.json()
+        _, data = make_request("POST", f"/orders/{created_order['id']}/publish", user_type="client", ctx=ctx)
         assert "message" in data
-        logger.info(f"Order published: {data['message']}")
-        return True
+        logger.info("Order published: %s", data['message'])
     
-    def test_get_available_orders(self):
+    def test_get_available_orders(self, ctx, driver_token):
         """Тест получения доступных заказов (для водителей)"""
-        if not tokens.get("driver"):
-            logger.warning("Skipping test - driver not logged in")
-            return True
-        
-        response = make_request("GET", "/orders/available", user_type="driver")
-        data = response.json()
+        _, data = make_request("GET", "/orders/available", LIST_PROBE, user_type="driver", ctx=ctx)
         assert isinstance(data, list)
-        logger.info(f"Retrieved {len(data)} available orders")
-        return True
+        logger.info("Available orders list OK (%s shown)", len(data))
     
-    def test_calculate_price(self):
+    def test_calculate_price(self, ctx, client_token):
         """Тест расчета стоимости перевозки"""
-        if not tokens.get("client"):
-            logger.warning("Skipping test - client not logged in")
-            return True
-        
         calc_data = {
             "from_lat": 55.7558,
             "from_lng": 37.6173,
@@ -355,112 +414,112 @@ class TestOrdersAPI:
             "volume": 12.0
         }
         
-        response = make_request("POST", "/orders/calculate-price", calc_data, user_type="client")
-        data = response.json()
+        data = calculate_price(calc_data, ctx)
         assert "suggested_price" in data
-        logger.info(f"Price calculated: {data['suggested_price']}")
-        return True
+        logger.info("Price calculated: %s", data['suggested_price'])
+    
+    @pytest.mark.xdist_group("writes")
+    def test_cancel_order(self, ctx, disposable_order):
+        """Тест отмены заказа"""
+        _, data = make_request("POST", f"/orders/{disposable_order}/cancel", user_type="client", ctx=ctx)
+        assert "message" in data
+        logger.info("Order cancelled: %s", data['message'])
 
-# Функция для запуска всех тестов
-def run_all_tests():
-    """Запуск всех тестов последовательно"""
-    test_classes = [
-        TestAuthAPI(),
-        TestUsersAPI(),
-        TestOrdersAPI()
-    ]
-    
-    total_tests = 0
-    passed_tests = 0
-    failed_tests = []
-    
-    logger.info("=" * 80)
-    logger.info("НАЧАЛО ТЕСТИРОВАНИЯ CARGO PRO API - БАЗОВЫЕ ТЕСТЫ")
-    logger.info("=" * 80)
-    
-    for test_class in test_classes:
-        class_name = test_class.__class__.__name__
-        logger.info(f"\nТестируем: {class_name}")
-        logger.info("-" * 60)
+class TestDriversAPI:
+    """Тесты для эндпоинтов водителей"""
+    
+    @pytest.mark.xdist_group("writes")
+    def test_create_driver_profile(self, extra_driver):
+        """Тест создания профиля водителя"""
+        profile = extra_driver["profile"]
+        assert profile["user_id"] == extra_driver["id"]
+        assert "vehicle_number" in profile
+        logger.info("Driver profile created: %s (%s)", extra_driver["email"], profile["vehicle_number"])
+
+class PassRateReport:
+    """Плагин pytest: итоги прогона и порог успешности для main()"""
+    
+    def __init__(self):
+        self.outcomes = {}
+        self.failed_tests = []
+        self.exit_reason = None
+    
+    def pytest_runtest_logreport(self, report):
+        # Тест считается по худшему из этапов (подготовка фикстур, вызов, очистка)
+        if report.failed:
+            if self.outcomes.get(report.nodeid) != "failed":
+                crash = getattr(report.longrepr, "reprcrash", None)
+                self.failed_tests.append(f"{report.nodeid}: {crash.message if crash else report.longreprtext}")
+            self.outcomes[report.nodeid] = "failed"
+        elif report.skipped:
+            self.outcomes.setdefault(report.nodeid, "skipped")
+        elif report.when == "call":
+            self.outcomes.setdefault(report.nodeid, "passed")
+    
+    def pytest_keyboard_interrupt(self, excinfo):
+        # pytest.exit из server_available: прогон прерван до тестов
+        self.exit_reason = str(excinfo.value)
+    
+    def summary(self):
+        """Вывод результатов; True, если пройдено не меньше 80% тестов"""
+        outcomes = list(self.outcomes.values())
+        total_tests = len(outcomes)
+        passed_tests = outcomes.count("passed") + outcomes.count("skipped") * 0.5  # Половина балла за пропущенные
         
-        # Получаем все методы тестирования из класса
-        test_methods = [method for method in dir(test_class) 
-                       if method.startswith('test_') and callable(getattr(test_class, method))]
+        report.info("\n" + _BANNER)
+        report.info("РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ")
+        report.info(_BANNER)
+        report.info("Всего тестов: %s", total_tests)
+        report.info("Пройдено: %.1f", passed_tests)
+        report.info("Успешность: %.1f%%", passed_tests / total_tests * 100 if total_tests else 0.0)
         
-        for method_name in test_methods:
-            total_tests += 1
-            method = getattr(test_class, method_name)
-            
-            try:
-                result = method()
-                if result:
-                    logger.info(f"✓ {method_name}: PASSED")
-                    passed_tests += 1
-                else:
-                    logger.warning(f"⚠ {method_name}: SKIPPED")
-                    passed_tests += 0.5  # Половина балла за пропущенные тесты
-            except AssertionError as e:
-                logger.error(f"✗ {method_name}: FAILED - Assertion Error: {str(e)}")
-                failed_tests.append(f"{class_name}.{method_name}: {str(e)}")
-            except Exception as e:
-                logger.error(f"✗ {method_name}: FAILED - {str(e)}")
-                failed_tests.append(f"{class_name}.{method_name}: {str(e)}")
-    
-    # Вывод результатов
-    logger.info("\n" + "=" * 80)
-    logger.info("РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ")
-    logger.info("=" * 80)
-    logger.info(f"Всего тестов: {total_tests}")
-    logger.info(f"Пройдено: {passed_tests:.1f}")
-    logger.info(f"Успешность: {(passed_tests/total_tests*100):.1f}%")
-    
-    if failed_tests:
-        logger.info("\nПРОВАЛЕННЫЕ ТЕСТЫ:")
-        for failed_test in failed_tests:
-            logger.info(f"  - {failed_test}")
-    else:
-        logger.info("\nВСЕ ТЕСТЫ ПРОЙДЕНЫ УСПЕШНО!")
+        if self.failed_tests:
+            report.info("\nПРОВАЛЕННЫЕ ТЕСТЫ:")
+            for failed_test in self.failed_tests:
+                report.info("  - %s", failed_test)
+        else:
+            report.info("\nВСЕ ТЕСТЫ ПРОЙДЕНЫ УСПЕШНО!")
+        
+        return total_tests > 0 and passed_tests >= total_tests * 0.8  # 80% успешности
+
+def run_all_tests():
+    """Запуск всех тестов модуля через pytest"""
+    report.info(_BANNER)
+    report.info("НАЧАЛО ТЕСТИРОВАНИЯ CARGO PRO API - БАЗОВЫЕ ТЕСТЫ")
+    report.info(_BANNER)
     
-    return passed_tests >= total_tests * 0.8  # 80% успешности
+    plugin = PassRateReport()
+    pytest.main(["-q", "-p", "no:cacheprovider", os.path.abspath(__file__)], plugins=[plugin])
+    if plugin.exit_reason:
+        raise pytest.exit.Exception(plugin.exit_reason)
+    return plugin.summary()
 
 def main():
     """Основная функция"""
-    # Проверка доступности сервера
+    report.info("Проверяю доступность сервера %s...", BASE_URL)
     try:
-        logger.info(f"Проверяю доступность сервера {BASE_URL}...")
-        response = requests.get(BASE_URL, timeout=10)
-        if response.status_code == 200:
-            logger.info(f"✓ Сервер доступен по адресу {BASE_URL}")
-            
-            # Запуск тестов
-            success = run_all_tests()
-            
-            if success:
-                logger.info("\n✅ ОСНОВНЫЕ ЭНДПОИНТЫ РАБОТАЮТ КОРРЕКТНО!")
-                logger.info("\nСледующие шаги:")
-                logger.info("1. Проверьте базу данных с помощью: python seed_data.py")
-                logger.info("2. Запустите полное тестирование после заполнения БД")
-                exit(0)
-            else:
-                logger.info("\n⚠ НЕКОТОРЫЕ ТЕСТЫ ПРОВАЛИЛИСЬ!")
-                logger.info("\nРекомендации:")
-                logger.info("1. Запустите: python seed_data.py для заполнения БД")
-                logger.info("2. Убедитесь, что сервер запущен: python run.py")
-                logger.info("3. Проверьте файл .env с настройками")
-                exit(1)
-        else:
-            logger.error(f"✗ Сервер недоступен или вернул ошибку: {response.status_code}")
-            exit(1)
-    except requests.exceptions.ConnectionError:
-        logger.error(f"✗ Не удалось подключиться к серверу {BASE_URL}")
-        logger.info("\nУбедитесь, что:")
-        logger.info("1. Сервер запущен (python run.py)")
-        logger.info("2. IP адрес верный (192.168.10.102)")
-        logger.info("3. Порт 8000 открыт")
-        logger.info("4. Файрвол не блокирует соединение")
+        success = run_all_tests()
+    except pytest.exit.Exception as e:
+        report.error("✗ %s", e)
+        report.info("\nУбедитесь, что:")
+        report.info("1. Сервер запущен (python run.py)")
+        report.info("2. IP адрес верный (192.168.10.102)")
+        report.info("3. Порт 8000 открыт")
+        report.info("4. Файрвол не блокирует соединение")
         exit(1)
-    except Exception as e:
-        logger.error(f"✗ Ошибка при подключении: {str(e)}")
+    
+    if success:
+        report.info("\n✅ ОСНОВНЫЕ ЭНДПОИНТЫ РАБОТАЮТ КОРРЕКТНО!")
+        report.info("\nСледующие шаги:")
+        report.info("1. Проверьте базу данных с помощью: python seed_data.py")
+        report.info("2. Запустите полное тестирование после заполнения БД")
+        exit(0)
+    else:
+        report.info("\n⚠ НЕКОТОРЫЕ ТЕСТЫ ПРОВАЛИЛИСЬ!")
+        report.info("\nРекомендации:")
+        report.info("1. Запустите: python seed_data.py для заполнения БД")
+        report.info("2. Убедитесь, что сервер запущен: python run.py")
+        report.info("3. Проверьте файл .env с настройками")
         exit(1)
 
 if __name__ == "__main__":